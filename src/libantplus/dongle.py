@@ -509,7 +509,7 @@ class Dongle:
             #  )
             except UnknownMessageID:
                 self.handler_logger.warning(
-                    "Received message with unknown id %d", message_dict["id"]
+                    "Received message with unknown id %s", message_dict["id"]
                 )
             except InvalidMessageError:
                 self.handler_logger.warning("Ignoring invalid message %s", message)
@@ -527,18 +527,16 @@ class Dongle:
         try:
             while item != SYNC:
                 item = self.messages_deque.popleft()
-            message = item.to_bytes()
         except IndexError:
             raise NoMessagesInDeque from None
-        item = None
+        message = [item]
         try:
             length = self.messages_deque.popleft()
-            message += length.to_bytes()
+            message.append(length)
 
             for _ in range(2, length + 4):
-                item = self.messages_deque.popleft()
-                message += item.to_bytes()
-            return message
+                message.append(self.messages_deque.popleft())
+            return bytes(message)
         except IndexError:
             for item in reversed(message):
                 self.messages_deque.appendleft(item)
@@ -3,15 +3,15 @@
 __version__ = "2023-04-16"
 # 2023-04-16    Rewritten in class based fashion
 
-import binascii
 import struct
-from typing import Dict
+from functools import reduce
+from operator import xor
+from typing import Callable, Dict, List, NamedTuple, Optional
 
 from enum import Enum
 
 import libantplus.structConstants as sc
 from libantplus.plus.page import AntPage
-from numpy import byte
 
 
 class Id(Enum):
@@ -50,6 +50,8 @@ class Id(Enum):
     OpenRxScan = 0x5B
 
 
+_ID_BY_VALUE = {member.value: member for member in Id}
+
 # Manufacturer ID       see FitSDKRelease_21.20.00 profile.xlsx
 Manufacturer_garmin = 1
 Manufacturer_dynastream = 15
@@ -59,84 +61,112 @@ Manufacturer_dev = 255
 
 SYNC = 0xA4
 
+_HEADER = struct.Struct(
+    sc.little_endian + sc.unsigned_char + sc.unsigned_char + sc.unsigned_char
+)
+_EXTENDED_IDS = frozenset({Id.BroadcastData, Id.AcknowledgedData, Id.BurstData})
+
+# Layouts of the extended data fields
+_CHANNEL_ID = struct.Struct(
+    sc.little_endian + sc.unsigned_short + sc.unsigned_char + sc.unsigned_char
+)
+_RSSI = struct.Struct(
+    sc.little_endian + sc.unsigned_char + sc.signed_char + sc.signed_char
+)
+_TIMESTAMP = struct.Struct(sc.little_endian + sc.unsigned_short)
+# Extended data size for each combination of the timestamp, RSSI and channel id
+# flag bits (0x20, 0x40 and 0x80), not counting the extra byte of AGC measurements
+_EXTENDED_DATA_SIZES = tuple(
+    (bits & 0b100 and _CHANNEL_ID.size)
+    + (bits & 0b010 and _RSSI.size)
+    + (bits & 0b001 and _TIMESTAMP.size)
+    for bits in range(8)
+)
+
+
+class DecomposedMessage(NamedTuple):
+    """Constituent parts of a message, as returned by :meth:`AntMessage.decompose`."""
+
+    sync: int
+    length: int
+    id: Optional[Id]
+    info: bytes
+    checksum: int
+    rest: str
+    channel: int
+    page_number: int
+    sequence_number: Optional[int]
+    flag: int
+    extended_data: bytes
+
+
+# Fields included in every :meth:`AntMessage.decompose_to_dict` result
+_DICT_FIELDS = DecomposedMessage._fields[:8]
+
 
 class AntMessage(bytes):
     """A message to be sent over an ANT+ interface."""
 
     types: Dict[Id, "type[AntMessage]"] = {}
+    _struct: struct.Struct
 
-    def __init__(self, data: bytes):
-        super(bytes, data)
+    def __init_subclass__(cls, **kwargs):
+        """Register the subclass and precompile :attr:`message_format`."""
+        super().__init_subclass__(**kwargs)
+        message_id = getattr(cls, "message_id", None)
+        if message_id is not None:
+            AntMessage.types.setdefault(message_id, cls)
+        if "message_format" in cls.__dict__:
+            cls._struct = struct.Struct(cls.message_format)
 
     @classmethod
     def compose(cls, message_id: Id, info: AntPage) -> "AntMessage":
         """Compose a message from its id and contents."""
-        fSynch = sc.unsigned_char
-        fLength = sc.unsigned_char
-        fId = sc.unsigned_char
-        fInfo = str(len(info)) + sc.char_array
-
-        message_format = sc.no_alignment + fSynch + fLength + fId + fInfo
-        data = struct.pack(message_format, SYNC, len(info), message_id.value, info)
-
-        data += calc_checksum(data)
+        length = len(info)
+        data = bytearray(length + 4)
+        if length < len(_COMPOSE_STRUCTS):
+            layout = _COMPOSE_STRUCTS[length]
+        else:
+            layout = _compose_struct(length)
+        layout.pack_into(data, 0, SYNC, length, message_id.value, info)
+        data[-1] = reduce(xor, info, SYNC ^ length ^ message_id.value)
 
-        return AntMessage(data)
+        return bytes.__new__(AntMessage, data)
 
     @classmethod
-    def decompose(cls, message) -> tuple:
+    def decompose(cls, message) -> "DecomposedMessage":
         """Decompose a message into its constituent parts."""
-        sync = 0
-        length = 0
-        messageID = None
-        checksum = 0
-        info = binascii.unhexlify("")  # NULL-string bytes
         rest = ""  # No remainder (normal)
         burst_sequence_number = None
         flag = 0
         extended_data = b""
 
-        try:
-            assert message[0] == SYNC
-            sync = message[0]
-            assert len(message) > 1
-            length = message[1]
-            assert len(message) == length + 4
-        except AssertionError:
-            print(length)
-            print(len(message))
-            raise InvalidMessageError from None
-
-        if len(message) > 2:
-            messageID = Id(message[2])
-        if len(message) > 3 + length:
-            if length:
-                info = message[3 : 3 + length]  # Info, if length > 0
-            checksum = message[3 + length]  # Character after info
-            assert checksum == int.from_bytes(calc_checksum(message))
-        if len(message) > 4 + length:
-            rest = message[4 + length :]  # Remainder (should not occur)
-
-        Channel = -1
-        DataPageNumber = -1
-        if length >= 1:
-            Channel = message[3]
-        if length >= 2:
-            DataPageNumber = message[4]
+        if len(message) < 4:
+            raise InvalidMessageError
+        sync, length, message_id = _HEADER.unpack_from(message)
+        if sync != SYNC or len(message) != length + 4:
+            raise InvalidMessageError
+
+        messageID = _ID_BY_VALUE.get(message_id)  # None if not a known Id
+        checksum = message[3 + length]  # Character after info
+        # The checksum byte xors the whole message to zero
+        assert reduce(xor, message, 0) == 0
+
+        Channel = message[3] if length >= 1 else -1
+        DataPageNumber = message[4] if length >= 2 else -1
 
         if messageID == Id.BurstData:
-            burst_sequence_number = (
-                Channel & 0b11100000
-            ) >> 5  # Upper 3 bits # noqa: F841
+            burst_sequence_number = (Channel & 0b11100000) >> 5  # Upper 3 bits
             Channel = Channel & 0b00011111  # Lower 5 bits
 
-        if messageID in (Id.BroadcastData, Id.AcknowledgedData, Id.BurstData):
-            if length > 9:
-                flag = info[9]
-                extended_data = info[10:length]
-                info = info[0:9]
+        if messageID in _EXTENDED_IDS and length > 9:
+            info = message[3:12]
+            flag = message[12]
+            extended_data = message[13 : 3 + length]
+        else:
+            info = message[3 : 3 + length]
 
-        return (
+        return DecomposedMessage(
             sync,
             length,
             messageID,
@@ -150,101 +180,131 @@ class AntMessage(bytes):
             extended_data,
         )
 
-    @staticmethod
-    def _decompose_extended_data(flag, extended_data) -> dict:
-        rtn = {}
-        count = 0
-        if (flag & 0x80) == 0x80:
-            rtn["channel_id"] = {}
-            rtn["channel_id"]["device_number"] = int.from_bytes(
-                extended_data[count : count + 2], byteorder="little"
-            )
-            rtn["channel_id"]["device_type_id"] = extended_data[count + 2]
-            rtn["channel_id"]["transmission_type"] = extended_data[count + 3]
-            count += 4
-        if (flag & 0x40) == 0x40:
-            rtn["rssi"] = {}
-            rtn["rssi"]["type"] = hex(extended_data[count])
-            if rtn["rssi"]["type"] == 0x20:
-                rtn["rssi"]["value"] = int.from_bytes(
-                    extended_data[count + 1].to_bytes(), signed=True
-                )
-                rtn["rssi"]["threshold"] = int.from_bytes(
-                    extended_data[count + 2].to_bytes(), signed=True
-                )
-            elif rtn["rssi"]["type"] == 0x10:
-                rtn["rssi"]["acg"] = int.from_bytes(
-                    extended_data[count + 1 : count + 2].to_bytes(), signed=True
-                )
-                rtn["rssi"]["threshold"] = int.from_bytes(
-                    extended_data[count + 2].to_bytes(), signed=True
-                )
-            count += 3
-            if rtn["rssi"]["type"] == 0x10:
-                count += 1
-        if (flag & 0x20) == 0x20:
-            rtn["timestamp"] = int.from_bytes(
-                extended_data[count : count + 2], byteorder="little"
-            )
-            count += 2
-
-        return rtn
-
     @classmethod
     def decompose_to_dict(cls, message) -> dict:
         """Decompose message into dictionary."""
-        rtn = {}
         response = cls.decompose(message)
-        rtn["sync"] = response[0]
-        rtn["length"] = response[1]
-        rtn["id"] = response[2]
-        rtn["info"] = response[3]
-        rtn["checksum"] = response[4]
-        rtn["rest"] = response[5]
-        rtn["channel"] = response[6]
-        rtn["page_number"] = response[7]
-        if rtn["id"] == Id.BurstData:
-            rtn["sequence_number"] = response[8]
-        if rtn["id"] in (Id.BroadcastData, Id.AcknowledgedData, Id.BurstData):
-            if response[9] != 0:
-                rtn["flag"] = response[9]
-                rtn["extended_data"] = response[10]
-                rtn["parsed_extended_data"] = cls._decompose_extended_data(
-                    response[9], response[10]
-                )
+        rtn = dict(zip(_DICT_FIELDS, response))
+        extend = _DICT_EXTENDERS.get(response.id)
+        if extend is not None:
+            extend(response, rtn)
 
         return rtn
 
+    @staticmethod
+    def verify_many(frames) -> List[bool]:
+        """Verify the checksum of each message in a buffer of concatenated messages.
+
+        A valid message starts with the sync byte and xors to zero up to and
+        including its checksum. A message that does not start with the sync byte,
+        or trailing bytes too short to hold a whole message, are reported as
+        invalid and end the walk, since the following boundaries are unknown.
+        """
+        rtn = []
+        offset = 0
+        while offset < len(frames):
+            if frames[offset] != SYNC or offset + 4 > len(frames):
+                rtn.append(False)
+                break
+            end = offset + frames[offset + 1] + 4
+            if end > len(frames):
+                rtn.append(False)
+                break
+            rtn.append(reduce(xor, frames[offset:end], 0) == 0)
+            offset = end
+        return rtn
+
     @classmethod
     def type_from_id(cls, message_id: Id):
         """Return message class for given Id."""
-        if not cls.types:
-            first_subclasses = AntMessage.__subclasses__()
-            subclasses = []
-            for subclass in first_subclasses:
-                subclasses += subclass.__subclasses__()
+        return cls.types.get(message_id)
+
+
+def _decompose_extended_data(flag, extended_data) -> dict:
+    size = _EXTENDED_DATA_SIZES[(flag >> 5) & 0b111]
+    if len(extended_data) < size:
+        raise InvalidMessageError
+    count = _CHANNEL_ID.size if flag & 0x80 else 0
+    if flag & 0x40 and extended_data[count] == 0x10:
+        # AGC measurements carry one more byte than RSSI ones
+        if len(extended_data) < size + 1:
+            raise InvalidMessageError
+
+    rtn = {}
+    if flag & 0x80:
+        device_number, device_type_id, transmission_type = (
+            _CHANNEL_ID.unpack_from(extended_data)
+        )
+        rtn["channel_id"] = {
+            "device_number": device_number,
+            "device_type_id": device_type_id,
+            "transmission_type": transmission_type,
+        }
+    if flag & 0x40:
+        measurement_type, first, second = _RSSI.unpack_from(extended_data, count)
+        if measurement_type == 0x20:
+            rtn["rssi"] = {
+                "type": hex(measurement_type),
+                "value": first,
+                "threshold": second,
+            }
+        elif measurement_type == 0x10:
+            rtn["rssi"] = {
+                "type": hex(measurement_type),
+                "acg": first,
+                "threshold": second,
+            }
+            count += 1
+        else:
+            rtn["rssi"] = {"type": hex(measurement_type)}
+        count += _RSSI.size
+    if flag & 0x20:
+        (rtn["timestamp"],) = _TIMESTAMP.unpack_from(extended_data, count)
 
-            for subclass in subclasses:
-                if hasattr(subclass, "message_id"):
-                    cls.types[subclass.message_id] = subclass
+    return rtn
+
+
+def _extend_extended_data(response: DecomposedMessage, rtn: dict):
+    if response.flag != 0:
+        rtn["flag"] = response.flag
+        rtn["extended_data"] = response.extended_data
+        rtn["parsed_extended_data"] = _decompose_extended_data(
+            response.flag, response.extended_data
+        )
+
+
+def _extend_burst_data(response: DecomposedMessage, rtn: dict):
+    rtn["sequence_number"] = response.sequence_number
+    _extend_extended_data(response, rtn)
+
+
+_DICT_EXTENDERS: Dict[Optional[Id], Callable[[DecomposedMessage, dict], None]] = {
+    Id.BroadcastData: _extend_extended_data,
+    Id.AcknowledgedData: _extend_extended_data,
+    Id.BurstData: _extend_burst_data,
+}
 
-        try:
-            return cls.types[message_id]
-        except KeyError:
-            return None
+
+def _compose_struct(length: int) -> struct.Struct:
+    """Return the header and info layout for an info of `length`."""
+    fSynch = sc.unsigned_char
+    fLength = sc.unsigned_char
+    fId = sc.unsigned_char
+    fInfo = str(length) + sc.char_array
+
+    return struct.Struct(sc.no_alignment + fSynch + fLength + fId + fInfo)
+
+
+# Precompiled layouts for every info length that occurs in practice
+_COMPOSE_STRUCTS = tuple(_compose_struct(length) for length in range(33))
 
 
 def calc_checksum(message):
     """Calculate checksum."""
-    xor_value = 0
     length = message[1]  # byte 1; length of info
     length += 3  # Add synch, len, id
-    for i in range(0, length):  # Process bytes as defined in length
-        xor_value = xor_value ^ message[i]
-
-    #   print('checksum', logfile.HexSpace(message), xor_value, bytes([xor_value]))
 
-    return bytes([xor_value])
+    return bytes([reduce(xor, message[:length], 0)])
 
 
 class SpecialMessageSend(AntMessage):
@@ -253,6 +313,14 @@ class SpecialMessageSend(AntMessage):
     message_id: Id
     message_format: str
     info: bytes
+    _pack: Callable[..., bytes]
+    _cache: Optional[Dict[tuple, AntMessage]] = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Bind :attr:`_pack` to the precompiled :attr:`message_format`."""
+        super().__init_subclass__(**kwargs)
+        if "message_format" in cls.__dict__:
+            cls._pack = cls._struct.pack
 
     def __new__(cls, **kwargs):
         """Return result of :meth:`create`.
@@ -267,7 +335,24 @@ class SpecialMessageSend(AntMessage):
 
     @classmethod
     def create(cls, **kwargs):
-        """Create message."""
+        """Create message.
+
+        Classes that set :attr:`_cache` reuse the message built for the same
+        arguments, keyed on their types as well as their values.
+        """
+        if cls._cache is None:
+            return cls._create(**kwargs)
+        key = tuple((name, type(arg), arg) for name, arg in sorted(kwargs.items()))
+        try:
+            return cls._cache[key]
+        except KeyError:
+            message = cls._cache[key] = cls._create(**kwargs)
+            return message
+        except TypeError:  # Unhashable argument
+            return cls._create(**kwargs)
+
+    @classmethod
+    def _create(cls, **kwargs):
         info = cls._parse_args(**kwargs)
         return cls.compose(cls.message_id, info)
 
@@ -287,14 +372,14 @@ class SpecialMessageReceive(AntMessage):
     @classmethod
     def _get_content(cls, message):
         info = cls._get_info(message)
-        return struct.unpack(cls.message_format, info)
+        return cls._struct.unpack(info)
 
     @classmethod
     def _get_info(cls, message):
-        message_id = cls.decompose_to_dict(message)["id"]
-        if message_id != cls.message_id:
-            raise WrongMessageId(message_id, cls.message_id)
-        return cls.decompose_to_dict(message)["info"]
+        response = cls.decompose(message)
+        if response.id != cls.message_id:
+            raise WrongMessageId(response.id, cls.message_id)
+        return response.info
 
 
 class OpenRxScanMessage(SpecialMessageSend):
@@ -302,10 +387,11 @@ class OpenRxScanMessage(SpecialMessageSend):
 
     message_id = Id.OpenRxScan
     message_format = sc.no_alignment + sc.unsigned_char + sc.unsigned_char
+    _cache = {}
 
     @classmethod
     def _parse_args(cls, **kwargs):
-        return struct.pack(cls.message_format, 0, 0)
+        return cls._pack(0, 0)
 
 
 class EnableExtendedMessagesMessage(SpecialMessageSend):
@@ -313,11 +399,12 @@ class EnableExtendedMessagesMessage(SpecialMessageSend):
 
     message_id = Id.EnableExtendedMessages
     message_format = sc.no_alignment + sc.unsigned_char + sc.unsigned_char
+    _cache = {}
 
     @classmethod
     def _parse_args(cls, **kwargs) -> bytes:
         enable = int(kwargs["enable"])
-        return struct.pack(cls.message_format, 0, enable)
+        return cls._pack(0, enable)
 
 
 class LibConfigMessage(SpecialMessageSend):
@@ -332,9 +419,7 @@ class LibConfigMessage(SpecialMessageSend):
         rssi = kwargs["rssi"] if "rssi" in kwargs else False
         channel_id = kwargs["channel_id"] if "channel_id" in kwargs else False
 
-        return struct.pack(
-            cls.message_format, 0, timestamp * 0x20 + rssi * 0x40 + channel_id * 0x80
-        )
+        return cls._pack(0, timestamp * 0x20 + rssi * 0x40 + channel_id * 0x80)
 
 
 class UnassignChannelMessage(SpecialMessageSend):
@@ -346,7 +431,7 @@ class UnassignChannelMessage(SpecialMessageSend):
     @classmethod
     def _parse_args(cls, **kwargs):
         channel = kwargs["channel"]
-        return struct.pack(cls.message_format, channel)
+        return cls._pack(channel)
 
 
 class AssignChannelMessage(SpecialMessageSend):
@@ -362,33 +447,33 @@ class AssignChannelMessage(SpecialMessageSend):
         channel = kwargs["channel"]
         channel_type = kwargs["type"].value
         network = kwargs["network"]
-        return struct.pack(cls.message_format, channel, channel_type, network)
+        return cls._pack(channel, channel_type, network)
 
 
 class SetChannelPeriodMessage(SpecialMessageSend):
     """Set period."""
 
     message_id = Id.ChannelPeriod
-    message_format = sc.no_alignment + sc.unsigned_char + sc.unsigned_short
+    message_format = sc.little_endian + sc.unsigned_char + sc.unsigned_short
 
     @classmethod
     def _parse_args(cls, **kwargs):
         channel = kwargs["channel"]
         period = kwargs["period"]
-        return struct.pack(cls.message_format, channel, period)
+        return cls._pack(channel, period)
 
 
 class SetChannelSearchTimeoutMessage(SpecialMessageSend):
     """Set search timeout."""
 
     message_id = Id.ChannelSearchTimeout
-    message_format = sc.no_alignment + sc.unsigned_char + sc.unsigned_short
+    message_format = sc.little_endian + sc.unsigned_char + sc.unsigned_short
 
     @classmethod
     def _parse_args(cls, **kwargs):
         channel = kwargs["channel"]
         timeout = kwargs["timeout"]
-        return struct.pack(cls.message_format, channel, timeout)
+        return cls._pack(channel, timeout)
 
 
 class SetChannelFrequencyMessage(SpecialMessageSend):
@@ -401,20 +486,21 @@ class SetChannelFrequencyMessage(SpecialMessageSend):
     def _parse_args(cls, **kwargs):
         channel = kwargs["channel"]
         frequency = kwargs["frequency"]
-        return struct.pack(cls.message_format, channel, frequency)
+        return cls._pack(channel, frequency)
 
 
 class SetNetworkKeyMessage(SpecialMessageSend):
     """Set network key."""
 
     message_id = Id.SetNetworkKey
-    message_format = sc.no_alignment + sc.unsigned_char + sc.unsigned_long_long
+    message_format = sc.little_endian + sc.unsigned_char + sc.unsigned_long_long
+    _cache = {}
 
     @classmethod
     def _parse_args(cls, **kwargs):
         network = kwargs["network"] if "network" in kwargs else 0x00
         key = kwargs["key"] if "key" in kwargs else 0x45C372BDFB21A5B9
-        return struct.pack(cls.message_format, network, key)
+        return cls._pack(network, key)
 
 
 class ResetSystemMessage(SpecialMessageSend):
@@ -422,10 +508,11 @@ class ResetSystemMessage(SpecialMessageSend):
 
     message_id = Id.ResetSystem
     message_format = sc.no_alignment + sc.unsigned_char
+    _cache = {}
 
     @classmethod
     def _parse_args(cls, **kwargs):
-        return struct.pack(cls.message_format, 0x00)
+        return cls._pack(0x00)
 
 
 class OpenChannelMessage(SpecialMessageSend):
@@ -437,7 +524,7 @@ class OpenChannelMessage(SpecialMessageSend):
     @classmethod
     def _parse_args(cls, **kwargs):
         channel = kwargs["channel"]
-        return struct.pack(cls.message_format, channel)
+        return cls._pack(channel)
 
 
 class CloseChannelMessage(SpecialMessageSend):
@@ -449,7 +536,7 @@ class CloseChannelMessage(SpecialMessageSend):
     @classmethod
     def _parse_args(cls, **kwargs):
         channel = kwargs["channel"]
-        return struct.pack(cls.message_format, channel)
+        return cls._pack(channel)
 
 
 class RequestMessage(SpecialMessageSend):
@@ -462,7 +549,7 @@ class RequestMessage(SpecialMessageSend):
     def _parse_args(cls, **kwargs):
         channel = kwargs["channel"] if "channel" in kwargs else 0
         requested_id = kwargs["id"].value
-        return struct.pack(cls.message_format, channel, requested_id)
+        return cls._pack(channel, requested_id)
 
 
 class SetChannelIdMessage(SpecialMessageSend, SpecialMessageReceive):
@@ -470,7 +557,7 @@ class SetChannelIdMessage(SpecialMessageSend, SpecialMessageReceive):
 
     message_id = Id.ChannelID
     message_format = (
-        sc.no_alignment
+        sc.little_endian
         + sc.unsigned_char
         + sc.unsigned_short
         + sc.unsigned_char
@@ -483,8 +570,7 @@ class SetChannelIdMessage(SpecialMessageSend, SpecialMessageReceive):
         device_number = kwargs["device_number"]
         device_type_id = kwargs["device_type_id"]
         transmission_type = int(kwargs["type"])
-        return struct.pack(
-            cls.message_format,
+        return cls._pack(
             channel,
             device_number,
             device_type_id,
@@ -514,7 +600,7 @@ class SetChannelTransmitPowerMessage(SpecialMessageSend):
     def _parse_args(cls, **kwargs):
         channel = kwargs["channel"]
         power = kwargs["power"]
-        return struct.pack(cls.message_format, channel, power)
+        return cls._pack(channel, power)
 
 
 class ChannelResponseMessage(SpecialMessageReceive):
@@ -531,8 +617,8 @@ class ChannelResponseMessage(SpecialMessageReceive):
         info = cls._get_info(message)
         rtn = {}
         rtn["channel"] = info[0]
-        rtn["id"] = Id(info[1])
-        rtn["code"] = cls.Code(info[2])
+        rtn["id"] = _ID_BY_VALUE.get(info[1])
+        rtn["code"] = _CODE_BY_VALUE.get(info[2])
 
         return rtn
 
@@ -574,6 +660,9 @@ class ChannelResponseMessage(SpecialMessageReceive):
         MESG_SERIAL_ERROR_ID = 174
 
 
+_CODE_BY_VALUE = {member.value: member for member in ChannelResponseMessage.Code}
+
+
 class StartupMessage(SpecialMessageReceive):
     """Sent by dongle on startup."""
 
@@ -585,13 +674,13 @@ class StartupMessage(SpecialMessageReceive):
         """Return bit field of startup reason."""
         info = cls._get_info(message)
         rtn = {}
-        bits = bin(info[0])[2:]
-        bits = "0" * (8 - len(bits)) + bits
+        reason = info[0]
+        bits = f"{reason:08b}"
         rtn["bits"] = bits
 
-        if info[0] == 0:
+        if reason == 0:
             reset_type = "POWER_ON_RESET"
-        elif bits[7 - 5] == "1":
+        elif reason & 0x20:
             reset_type = "COMMAND_RESET"
         else:
             reset_type = ""
@@ -605,72 +694,71 @@ class CapabilitiesMessage(SpecialMessageReceive):
 
     message_id = Id.Capabilities
 
+    _standard_options = (
+        ("CAPABILITIES_NO_RECEIVE_CHANNELS", 0x01),
+        ("CAPABILITIES_NO_TRANSMIT_CHANNELS", 0x02),
+        ("CAPABILITIES_NO_RECEIVE_MESSAGES", 0x04),
+        ("CAPABILITIES_NO_TRANSMIT_MESSAGES", 0x08),
+        ("CAPABILITIES_NO_ACKD_MESSAGES", 0x10),
+        ("CAPABILITIES_NO_BURST_MESSAGES", 0x20),
+    )
+    _advanced_options = (
+        ("CAPABILITIES_NETWORK_ENABLED", 0x02),
+        ("CAPABILITIES_SERIAL_NUMBER_ENABLED", 0x08),
+        ("CAPABILITIES_PER_CHANNEL_TX_POWER_ENABLED", 0x10),
+        ("CAPABILITIES_LOW_PRIORITY_SEARCH_ENABLED", 0x20),
+        ("CAPABILITIES_SCRIPT_ENABLED", 0x40),
+        ("CAPABILITIES_SEARCH_LIST_ENABLED", 0x80),
+    )
+    _advanced_options2 = (
+        ("CAPABILITIES_LED_ENABLED", 0x01),
+        ("CAPABILITIES_EXT_MESSAGE_ENABLED", 0x02),
+        ("CAPABILITIES_SCAN_MODE_ENABLED", 0x04),
+        ("CAPABILITIES_PROX_SEARCH_ENABLED", 0x10),
+        ("CAPABILITIES_EXT_ASSIGN_ENABLED", 0x20),
+        ("CAPABILITIES_FS_ANTFS_ENABLED", 0x40),
+        ("CAPABILITIES_FIT1_ENABLED", 0x80),
+    )
+
     @classmethod
     def to_dict(cls, message) -> dict:
         """Return max channels and networks."""
         info = cls._get_info(message)
-        length = cls.decompose_to_dict(message)["length"]
+        length = len(info)
         rtn = {}
         if length > 0:
             rtn["max_channels"] = info[0]
         if length > 1:
             rtn["max_networks"] = info[1]
         if length > 2:
-            bits = bin(info[2])[2:]
-            bits = "0" * (8 - len(bits)) + bits
-            rtn["standard_options"] = bits
-            rtn["standard_options_parsed"] = cls._parse_standard_options(bits)
+            rtn["standard_options"] = f"{info[2]:08b}"
+            rtn["standard_options_parsed"] = cls._parse_standard_options(info[2])
         if length > 3:
-            bits = bin(info[3])[2:]
-            bits = "0" * (8 - len(bits)) + bits
-            rtn["advanced_options"] = bits
-            rtn["advanced_options_parsed"] = cls._parse_advanced_options(bits)
+            rtn["advanced_options"] = f"{info[3]:08b}"
+            rtn["advanced_options_parsed"] = cls._parse_advanced_options(info[3])
         if length > 4:
-            bits = bin(info[4])[2:]
-            bits = "0" * (8 - len(bits)) + bits
-            rtn["advanced_options2"] = bits
-            rtn["advanced_options2_parsed"] = cls._parse_advanced_options2(bits)
+            rtn["advanced_options2"] = f"{info[4]:08b}"
+            rtn["advanced_options2_parsed"] = cls._parse_advanced_options2(info[4])
         if length > 5:
             rtn["max_sensrcore_channels"] = info[5]
 
         return rtn
 
     @staticmethod
-    def _parse_standard_options(bits):
-        rtn = {}
-        rtn["CAPABILITIES_NO_RECEIVE_CHANNELS"] = bits[7]
-        rtn["CAPABILITIES_NO_TRANSMIT_CHANNELS"] = bits[6]
-        rtn["CAPABILITIES_NO_RECEIVE_MESSAGES"] = bits[5]
-        rtn["CAPABILITIES_NO_TRANSMIT_MESSAGES"] = bits[4]
-        rtn["CAPABILITIES_NO_ACKD_MESSAGES"] = bits[3]
-        rtn["CAPABILITIES_NO_BURST_MESSAGES"] = bits[2]
-
-        return rtn
-
-    @staticmethod
-    def _parse_advanced_options(bits):
-        rtn = {}
-        rtn["CAPABILITIES_NETWORK_ENABLED"] = bits[6]
-        rtn["CAPABILITIES_SERIAL_NUMBER_ENABLED"] = bits[4]
-        rtn["CAPABILITIES_PER_CHANNEL_TX_POWER_ENABLED"] = bits[3]
-        rtn["CAPABILITIES_LOW_PRIORITY_SEARCH_ENABLED"] = bits[3]
-        rtn["CAPABILITIES_SCRIPT_ENABLED"] = bits[1]
-        rtn["CAPABILITIES_SEARCH_LIST_ENABLED"] = bits[0]
+    def _parse_options(options, table) -> dict:
+        return {name: bool(options & mask) for name, mask in table}
 
-        return rtn
+    @classmethod
+    def _parse_standard_options(cls, options):
+        return cls._parse_options(options, cls._standard_options)
 
-    @staticmethod
-    def _parse_advanced_options2(bits):
-        rtn = {}
-        rtn["CAPABILITIES_LED_ENABLED"] = bits[7]
-        rtn["CAPABILITIES_EXT_MESSAGE_ENABLED"] = bits[6]
-        rtn["CAPABILITIES_SCAN_MODE_ENABLED"] = bits[5]
-        rtn["CAPABILITIES_PROX_SEARCH_ENABLED"] = bits[3]
-        rtn["CAPABILITIES_EXT_ASSIGN_ENABLED"] = bits[2]
-        rtn["CAPABILITIES_FS_ANTFS_ENABLED"] = bits[1]
-        rtn["CAPABILITIES_FIT1_ENABLED"] = bits[0]
+    @classmethod
+    def _parse_advanced_options(cls, options):
+        return cls._parse_options(options, cls._advanced_options)
 
-        return rtn
+    @classmethod
+    def _parse_advanced_options2(cls, options):
+        return cls._parse_options(options, cls._advanced_options2)
 
 
 class VersionMessage(SpecialMessageReceive):